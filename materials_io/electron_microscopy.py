@@ -1,19 +1,499 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 import logging
+import os
 import re
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, Optional, Iterable, Iterator, Pattern, Type
 
 from hyperspy.io import load as hs_load
 from traits.trait_base import Undefined
 
 from materials_io.base import BaseSingleFileParser
 from materials_io.utils import get_nested_dict_value_by_path as get_val
-from materials_io.utils import \
-    map_dict_values, MappingElements, standardize_unit
+from materials_io.utils import map_table_values, standardize_unit
 from materials_io.utils import set_nested_dict_value_with_units as set_val_units
 
 logger = logging.getLogger(__name__)
 
 
+def _div_1000(x: float) -> float:
+    """Shared conversion function for the milli/kilo unit mappings"""
+    return x / 1000
+
+
+def _mul_1000(x: float) -> float:
+    """Shared conversion function for the kilo/milli unit mappings"""
+    return x * 1000
+
+
+# Mapping tables are tuples of (source_path, dest_path, cast_fn, units,
+# conv_fn) rows. Source paths are relative to a base path that is only known
+# once a file has been read; see :func:`~materials_io.utils.map_table_values`
+
+# HyperSpy metadata, relative to ``Acquisition_instrument.<SEM|TEM>``
+_HS_INST_MAPPINGS = (
+    (('acquisition_mode',), ('General_EM', 'acquisition_mode'),
+     str, None, None),
+    (('beam_current',), ('General_EM', 'beam_current'),
+     float, 'NanoA', None),
+    (('beam_energy',), ('General_EM', 'beam_energy'),
+     float, 'KiloEV', None),
+    (('convergence_angle',), ('General_EM', 'convergence_angle'),
+     float, 'MilliRAD', None),
+    (('magnification',), ('General_EM', 'magnification_indicated'),
+     float, 'UNITLESS', None),
+    (('microscope',), ('General_EM', 'microscope_name'),
+     str, None, None),
+    (('probe_area',), ('General_EM', 'probe_area'),
+     float, 'NanoM2', None),
+
+    # stage positions
+    (('Stage', 'rotation'), ('General_EM', 'stage_position', 'rotation'),
+     float, 'DEG', None),
+    (('Stage', 'tilt_alpha'), ('General_EM', 'stage_position', 'tilt_alpha'),
+     float, 'DEG', None),
+    (('Stage', 'tilt_beta'), ('General_EM', 'stage_position', 'tilt_beta'),
+     float, 'DEG', None),
+    (('Stage', 'x'), ('General_EM', 'stage_position', 'x'),
+     float, 'MilliM', None),
+    (('Stage', 'y'), ('General_EM', 'stage_position', 'y'),
+     float, 'MilliM', None),
+    (('Stage', 'z'), ('General_EM', 'stage_position', 'z'),
+     float, 'MilliM', None),
+
+    # camera length/working distance
+    (('camera_length',), ('TEM', 'camera_length'),
+     float, 'MilliM', None),
+    (('working_distance',), ('SEM', 'working_distance'),
+     float, 'MilliM', None),
+)
+
+# HyperSpy metadata, relative to the root of the metadata tree
+_HS_GENERAL_MAPPINGS = (
+    # Elements present (if known)
+    (('Sample', 'elements'), ('General_EM', 'elements'), list, None, None),
+    # General metadata
+    (('General', 'date'), ('General', 'date'), str, None, None),
+    (('General', 'doi'), ('General', 'doi'), str, None, None),
+    (('General', 'original_filename'), ('General', 'original_filename'),
+     str, None, None),
+    (('General', 'notes'), ('General', 'notes'), str, None, None),
+    (('General', 'time'), ('General', 'time'), str, None, None),
+    (('General', 'time_zone'), ('General', 'time_zone'), str, None, None),
+    (('General', 'title'), ('General', 'title'), str, None, None),
+)
+
+# HyperSpy metadata, relative to ``Acquisition_instrument.<SEM|TEM>.Detector``
+_HS_DETECTOR_MAPPINGS = (
+    # EDS
+    (('EDS', 'azimuth_angle'), ('EDS', 'azimuth_angle'),
+     float, 'DEG', None),
+    (('EDS', 'elevation_angle'), ('EDS', 'elevation_angle'),
+     float, 'DEG', None),
+    (('EDS', 'energy_resolution_MnKa'), ('EDS', 'energy_resolution_MnKa'),
+     float, 'EV', None),
+    (('EDS', 'live_time'), ('EDS', 'live_time'),
+     float, 'SEC', None),
+    (('EDS', 'real_time'), ('EDS', 'real_time'),
+     float, 'SEC', None),
+
+    # EELS
+    (('EELS', 'aperture_size'), ('EELS', 'aperture_size'),
+     float, 'MilliM', None),
+    (('EELS', 'collection_angle'), ('EELS', 'collection_angle'),
+     float, 'MilliRAD', None),
+    (('EELS', 'dwell_time'), ('General_EM', 'dwell_time'),
+     float, 'SEC', None),
+    (('EELS', 'exposure'), ('General_EM', 'exposure_time'),
+     float, 'SEC', None),
+    (('EELS', 'frame_number'), ('EELS', 'number_of_samples'),
+     int, 'NUM', None),
+    (('EELS', 'spectrometer'), ('EELS', 'spectrometer_name'),
+     str, None, None),
+)
+
+# DigitalMicrograph tags, relative to the section (within the DM3 tags)
+# given in _DM3_GENERAL_SECTIONS
+_DM3_MICROSCOPE_INFO_MAPPINGS = (
+    (('Indicated Magnification',),
+     ('General_EM', 'magnification_indicated'), float, 'UNITLESS', None),
+    (('Actual Magnification',),
+     ('General_EM', 'magnification_actual'), float, 'UNITLESS', None),
+    (('Cs(mm)',),
+     ('TEM', 'spherical_aberration_coefficient'), float, 'MilliM', None),
+    (('STEM Camera Length',),
+     ('TEM', 'camera_length'), float, 'MilliM', None),
+    (('Operation Mode',),
+     ('TEM', 'operation_mode'), str, None, None),
+    (('Imaging Mode',),
+     ('TEM', 'imaging_mode'), str, None, None),
+    (('Illumination Mode',),
+     ('TEM', 'illumination_mode'), str, None, None),
+    (('Microscope',),
+     ('General_EM', 'microscope_name'), str, None, None),
+    (('Stage Position', 'Stage X'),
+     ('General_EM', 'stage_position', 'x'), float, 'MilliM', _div_1000),
+    (('Stage Position', 'Stage Y'),
+     ('General_EM', 'stage_position', 'y'), float, 'MilliM', _div_1000),
+    (('Stage Position', 'Stage Z'),
+     ('General_EM', 'stage_position', 'z'), float, 'MilliM', _div_1000),
+    (('Stage Position', 'Stage Alpha'),
+     ('General_EM', 'stage_position', 'tilt_alpha'), float, 'DEG', None),
+    (('Stage Position', 'Stage Beta'),
+     ('General_EM', 'stage_position', 'tilt_beta'), float, 'DEG', None),
+    (('Emission Current (µA)',),
+     ('General_EM', 'emission_current'), float, 'MicroA', None),
+)
+
+_DM3_SESSION_INFO_MAPPINGS = (
+    (('Detector',), ('General_EM', 'detector_name'), str, None, None),
+    (('Microscope',), ('General_EM', 'microscope_name'), str, None, None),
+)
+
+_DM3_META_DATA_MAPPINGS = (
+    (('Acquisition Mode',), ('TEM', 'acquisition_mode'), str, None, None),
+    (('Format',), ('TEM', 'acquisition_format'), str, None, None),
+    (('Signal',), ('TEM', 'acquisition_signal'), str, None, None),
+    # sometimes the EDS signal label is in a different place
+    (('Experiment keywords', 'TagGroup1', 'Label'),
+     ('TEM', 'acquisition_signal'), str, None, None),
+)
+
+# a few miscellaneous DM tags:
+_DM3_MISC_MAPPINGS = (
+    (('Acquisition', 'Device', 'Name'),
+     ('TEM', 'acquisition_device'), str, None, None),
+    (('DataBar', 'Device Name'),
+     ('TEM', 'acquisition_device'), str, None, None),
+    (('Acquisition', 'Parameters', 'High Level', 'Exposure (s)'),
+     ('General_EM', 'exposure_time'), float, 'SEC', None),
+    (('DataBar', 'Exposure Time (s)'),
+     ('General_EM', 'exposure_time'), float, 'SEC', None),
+    (('GMS Version', 'Created'),
+     ('General_EM', 'acquisition_software_version'), str, None, None),
+)
+
+_DM3_GENERAL_SECTIONS = (
+    (('Microscope Info',), _DM3_MICROSCOPE_INFO_MAPPINGS),
+    (('Session Info',), _DM3_SESSION_INFO_MAPPINGS),
+    (('Meta Data',), _DM3_META_DATA_MAPPINGS),
+    ((), _DM3_MISC_MAPPINGS),
+)
+
+
+def _cast_mm(s: str) -> float:
+    """Cast a length label such as ``'2.5 mm'`` or ``'3mm'`` to a number of
+    millimeters"""
+    return float(s[:-2]) if s.endswith('mm') else float(s)
+
+
+# DigitalMicrograph EELS tags, relative to ``EELS`` within the DM3 tags
+_DM3_EELS_MAPPINGS = (
+    (('Acquisition', 'Exposure (s)'),
+     ('General_EM', 'exposure_time'), float, 'SEC', None),
+    (('Acquisition', 'Integration time (s)'),
+     ('EELS', 'integration_time'), float, 'SEC', None),
+    (('Acquisition', 'Number of frames'),
+     ('EELS', 'number_of_samples'), int, 'NUM', None),
+    (('Experimental Conditions', 'Collection semi-angle (mrad)'),
+     ('EELS', 'collection_angle'), float, 'MilliRAD', None),
+    (('Experimental Conditions', 'Convergence semi-angle (mrad)'),
+     ('General_EM', 'convergence_angle'), float, 'MilliRAD', None),
+)
+
+# DigitalMicrograph EELS spectrometer tags, relative to the spectrometer group
+# (see _DM3_EELS_SPECTROMETER_PATHS)
+_DM3_EELS_SPECTROMETER_MAPPINGS = (
+    (('Aperture label',),
+     ('EELS', 'aperture_size'), _cast_mm, 'MilliM', None),
+    (('Dispersion (eV/ch)',),
+     ('EELS', 'dispersion_per_channel'), float, 'EV', None),
+    (('Energy loss (eV)',),
+     ('EELS', 'energy_loss_offset'), float, 'EV', None),
+    (('Instrument name',),
+     ('EELS', 'spectrometer_name'), str, None, None),
+    (('Drift tube voltage (V)',),
+     ('EELS', 'drift_tube_voltage'), float, 'V', None),
+    (('Drift tube enabled',),
+     ('EELS', 'drift_tube_enabled'), bool, None, None),
+    (('Prism offset (V)',),
+     ('EELS', 'prism_shift_voltage'), float, 'V', None),
+    # note space at end of "Prism offset enabled " because that's how
+    # it gets loaded in from DigitalMicrograph...
+    (('Prism offset enabled ',),
+     ('EELS', 'prism_shift_enabled'), bool, None, None),
+    (('Slit width (eV)',),
+     ('EELS', 'filter_slit_width'), float, 'EV', None),
+    (('Slit inserted',),
+     ('EELS', 'filter_slit_inserted'), bool, None, None),
+)
+
+# DigitalMicrograph EDS tags, relative to ``EDS`` within the DM3 tags
+_DM3_EDS_MAPPINGS = (
+    (('Detector Info', 'Azimuthal angle'),
+     ('EDS', 'azimuth_angle'), float, 'DEG', None),
+    (('Detector Info', 'Detector type'),
+     ('EDS', 'detector_type'), str, None, None),
+    (('Acquisition', 'Dispersion (eV)'),
+     ('EDS', 'dispersion_per_channel'), float, 'EV', None),
+    (('Detector Info', 'Elevation angle'),
+     ('EDS', 'elevation_angle'), float, 'DEG', None),
+    (('Detector Info', 'Incidence angle'),
+     ('EDS', 'incidence_angle'), float, 'DEG', None),
+    (('Live time',),
+     ('EDS', 'live_time'), float, 'SEC', None),
+    (('Real time',),
+     ('EDS', 'real_time'), float, 'SEC', None),
+    (('Detector Info', 'Solid angle'),
+     ('EDS', 'solid_angle'), float, 'SR', None),
+    (('Detector Info', 'Stage tilt'),
+     ('EDS', 'stage_tilt'), float, 'DEG', None),
+)
+
+
+# The DM3 tags of interest are found under one of two subtrees of the original
+# metadata (see ElectronMicroscopyParser.__get_dm3_tags), which is resolved
+# once per file; the DM3 tables above are relative to that subtree
+_DM3_IMAGE_TAGS = ('ImageList', 'TagGroup0', 'ImageTags')
+# relative to _DM3_IMAGE_TAGS, present if the file contains a stack of images
+_DM3_STACK_TAGS = ('plane info', 'TagGroup0', 'source tags')
+
+# the EELS spectrometer group is usually at one of two places, so try both
+_DM3_EELS_SPECTROMETER_PATHS = (('EELS', 'Acquisition', 'Spectrometer'),
+                                ('EELS Spectrometer',))
+
+# (units, conv_fn) for the DM3 accelerating voltage, which is reported in kV
+# once it reaches 1000 V
+_VOLT_HIGH = ('KiloV', _div_1000)
+_VOLT_LOW = ('V', None)
+
+
+def _float_if_nonzero(x) -> Optional[float]:
+    """Cast a value to a float, treating zero (as well as empty values) as
+    missing"""
+    return float(x) if x else None
+
+
+# TIA (.ser/.emi) tags, relative to the root of the original metadata
+_TIA_MAPPINGS = (
+    (('ObjectInfo', 'ExperimentalConditions', 'MicroscopeConditions',
+      'AcceleratingVoltage'),
+     ('General_EM', 'accelerating_voltage'), float, 'V', None),
+
+    (('ObjectInfo', 'AcquireInfo', 'DwellTimePath'),
+     ('General_EM', 'dwell_time'), float, 'SEC', None),
+    (('ObjectInfo', 'AcquireInfo', 'FrameTime'),
+     ('General_EM', 'frame_time'), float, 'SEC', None),
+
+    (('ObjectInfo', 'ExperimentalDescription', 'Microscope'),
+     ('General_EM', 'microscope_name'), str, None, None),
+    (('ObjectInfo', 'ExperimentalDescription', 'High tension_kV'),
+     ('General_EM', 'accelerating_voltage'), float, 'KiloV', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Emission_uA'),
+     ('General_EM', 'emission_current'), float, 'MicroA', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Defocus_um'),
+     ('TEM', 'defocus'), float, 'MicroM', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Magnification_x'),
+     ('General_EM', 'magnification_indicated'), float, 'UNITLESS', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Camera length_m'),
+     ('TEM', 'camera_length'), float, 'M', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Spot size'),
+     ('TEM', 'spot_size'), int, 'UNITLESS', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Stage X_um'),
+     ('General_EM', 'stage_position', 'x'), float, 'MicroM', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Stage Y_um'),
+     ('General_EM', 'stage_position', 'y'), float, 'MicroM', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Stage Z_um'),
+     ('General_EM', 'stage_position', 'z'), float, 'MicroM', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Stage A_deg'),
+     ('General_EM', 'stage_position', 'tilt_alpha'), float, 'DEG', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Stage B_deg'),
+     ('General_EM', 'stage_position', 'tilt_beta'), float, 'DEG', None),
+
+    (('ObjectInfo', 'ExperimentalDescription', 'Filter mode'),
+     ('EELS', 'spectrometer_mode'), str, None, None),
+    (('ObjectInfo', 'ExperimentalDescription',
+      'Filter selected dispersion_eV/Channel'),
+     ('EELS', 'dispersion_per_channel'), float, 'EV', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Filter selected aperture'),
+     ('EELS', 'aperture_size'), _cast_mm, 'MilliM', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Filter prism shift_eV'),
+     ('EELS', 'prism_shift_energy'), float, 'EV', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Filter drift tube_eV'),
+     ('EELS', 'drift_tube_energy'), float, 'EV', None),
+    (('ObjectInfo', 'ExperimentalDescription', 'Filter total energy loss_eV'),
+     ('EELS', 'total_energy_loss'), float, 'EV', None),
+)
+
+# this value is often more specific than the one from HyperSpy,
+# so override acquisition mode:
+_TIA_OVERRIDE_MAPPINGS = (
+    (('ObjectInfo', 'ExperimentalDescription', 'Mode'),
+     ('General_EM', 'acquisition_mode'), str, None, str.strip),
+)
+
+# FEI/ThermoFisher tiff tags, relative to ``fei_metadata``
+_TIFF_MAPPINGS = (
+    (('System', 'Software'),
+     ('General_EM', 'acquisition_software_version'), str, None, None),
+    (('Beam', 'Spot'), ('SEM', 'spot_size'), int, None, None),
+    (('Beam', 'HV'),
+     ('General_EM', 'accelerating_voltage'), float, 'KiloV', _div_1000),
+    (('EBeam', 'HV'),
+     ('General_EM', 'accelerating_voltage'), float, 'KiloV', _div_1000),
+    (('EBeam', 'HFW'), ('SEM', 'horizontal_field_width'), float, 'M', None),
+    (('EBeam', 'VFW'), ('SEM', 'vertical_field_width'), float, 'M', None),
+    (('EBeam', 'WD'), ('SEM', 'working_distance'), float, 'M', None),
+    (('EBeam', 'BeamCurrent'),
+     ('General_EM', 'beam_current'), float, 'A', None),
+
+    (('Scan', 'PixelWidth'), ('SEM', 'pixel_width'), float, 'M', None),
+    (('Scan', 'PixelHeight'), ('SEM', 'pixel_height'), float, 'M', None),
+    (('Scan', 'HorFieldsize'),
+     ('SEM', 'horizontal_field_width'), float, 'M', None),
+    (('Scan', 'VerFieldsize'),
+     ('SEM', 'vertical_field_width'), float, 'M', None),
+    (('Scan', 'FrameTime'),
+     ('General_EM', 'frame_time'), _float_if_nonzero, 'SEC', None),
+    (('Image', 'MagnificationMode'),
+     ('SEM', 'magnification_mode'), None, None, None),
+    # confirmed in Quanta SEM manual that the pressure units are Pascals
+    (('Vacuum', 'ChPressure'),
+     ('SEM', 'chamber_pressure'), _float_if_nonzero, 'PA', None),
+)
+
+# the stage position in the tiff tags overrides that from HyperSpy
+_TIFF_STAGE_MAPPINGS = (
+    (('Stage', 'StageX'),
+     ('General_EM', 'stage_position', 'x'), float, 'MilliM', _mul_1000),
+    (('Stage', 'StageY'),
+     ('General_EM', 'stage_position', 'y'), float, 'MilliM', _mul_1000),
+    (('Stage', 'StageZ'),
+     ('General_EM', 'stage_position', 'z'), float, 'MilliM', _mul_1000),
+    (('Stage', 'StageR'),
+     ('General_EM', 'stage_position', 'rotation'), float, 'DEG', None),
+    (('Stage', 'StageT'),
+     ('General_EM', 'stage_position', 'tilt_alpha'), float, 'DEG', None),
+    (('Stage', 'StageTb'),
+     ('General_EM', 'stage_position', 'tilt_beta'), float, 'DEG', None),
+)
+
+
+# Prefixes of the lines of the Tecnai string that hold values of interest; the
+# extractor voltage and emission current are found within the "Gun " line
+_TECNAI_PREFIXES = ('Microscope ', 'Gun ', 'Mode ', 'Spot ', 'Stage',
+                    'Filter related settings', 'Mode: ', 'Selected dispersion: ',
+                    'Selected aperture: ', 'Prism shift: ', 'Drift tube: ',
+                    'Total energy loss: ')
+
+
+# Mappings of the values extracted from the Tecnai string (keys of
+# ``tecnai_vals`` in ElectronMicroscopyParser._dm3_tecnai_info); of the two
+# defocus extractions, the diffraction mode one is mapped last so that it wins
+_TECNAI_MAPPINGS = (
+    (('Microscope_Name',), ('General_EM', 'microscope_name'), str, None,
+     None),
+    (('Extractor_Voltage',), ('TEM', 'extractor_voltage'), int, 'V', None),
+    (('Emission_Current',), ('General_EM', 'emission_current'), float,
+     'MicroA', None),
+    (('Operation_Mode',), ('TEM', 'operation_mode'), str, None, None),
+    (('Defocus_Mag',), ('TEM', 'defocus'), float, 'MicroM', None),
+    (('Defocus_Diff',), ('TEM', 'defocus'), float, 'MicroM', None),
+    (('Magnification',), ('General_EM', 'magnification_indicated'), int,
+     'UNITLESS', None),
+    (('Camera_Length',), ('TEM', 'camera_length'), float, 'MilliM',
+     _mul_1000),
+    (('Spot_Size',), ('TEM', 'spot_size'), int, 'UNITLESS', None),
+)
+_TECNAI_STAGE_MAPPINGS = (
+    (('Stage_X',), ('General_EM', 'stage_position', 'x'), float, 'MicroM',
+     None),
+    (('Stage_Y',), ('General_EM', 'stage_position', 'y'), float, 'MicroM',
+     None),
+    (('Stage_Z',), ('General_EM', 'stage_position', 'z'), float, 'MicroM',
+     None),
+    (('Stage_A',), ('General_EM', 'stage_position', 'tilt_alpha'), float,
+     'DEG', None),
+    (('Stage_B',), ('General_EM', 'stage_position', 'tilt_beta'), float,
+     'DEG', None),
+)
+_TECNAI_FILTER_MAPPINGS = (
+    (('Filter_Mode',), ('EELS', 'spectrometer_mode'), str, None, None),
+    (('Filter_Dispersion',), ('EELS', 'dispersion_per_channel'), float, 'EV',
+     None),
+    (('Filter_Aperture',), ('EELS', 'aperture_size'), float, 'MilliM', None),
+    (('Filter_Drift',), ('EELS', 'drift_tube_energy'), float, 'EV', None),
+    (('Filter_Prism',), ('EELS', 'prism_shift_energy'), float, 'EV', None),
+    (('Filter_TotalLoss',), ('EELS', 'total_energy_loss'), float, 'EV', None),
+)
+
+
+@lru_cache(maxsize=None)
+def _tecnai_patterns() -> Dict[str, Pattern]:
+    """Compile the patterns for values within the FEI Tecnai "Microscope Info"
+    string (see ElectronMicroscopyParser._dm3_tecnai_info). These are only
+    compiled the first time a file with Tecnai info is parsed, and are cached
+    for every subsequent call
+    """
+    return {
+        'extr_volt': re.compile(r'Extr volt (\d*) V'),
+        'emission': re.compile(r'Emission ([\d|\.]*)uA'),
+        'operation_mode': re.compile(r'(.*) Defocus'),
+        'defocus_mag': re.compile(r'Defocus \(um\) (.*) Magn'),
+        'defocus_diff': re.compile(r'Defocus ([\d|\.]*) CL'),
+        'magnification': re.compile(r'Magn (\d*)x'),
+        'camera_length': re.compile(r'CL (.*)m'),
+        # stage x, y, z (in um), then alpha and beta tilts (in deg)
+        'stage': re.compile(r' (-?\d*\.\d*) (?:um|deg)'),
+        'dispersion': re.compile(r'(.*)\[eV/Channel\]'),
+        'aperture': re.compile(r'(\d*)mm'),
+        'ev': re.compile(r'(.*)\[eV\]'),
+    }
+
+
+@lru_cache(maxsize=None)
+def _tecnai_line_pattern(delimiter: str) -> Pattern:
+    """Compile a pattern matching any of ``_TECNAI_PREFIXES`` (longest first)
+    at the start of a line of a Tecnai string, capturing the prefix and the
+    rest of that line
+    """
+    delim = re.escape(delimiter)
+    prefixes = '|'.join(re.escape(p) for p in
+                        sorted(_TECNAI_PREFIXES, key=len, reverse=True))
+    # the rest of the line runs up to the next (possibly multi-character)
+    # delimiter, so the delimiter must not be used as a character class
+    return re.compile('(?:^|{0})({1})((?:(?!{0}).)*)'.format(delim, prefixes),
+                      re.S)
+
+
+def _tecnai_index(tecnai_info: str, delimiter: str) -> Dict[str, str]:
+    """Index the lines of a Tecnai string (separated by ``delimiter``) by
+    their prefix (one of ``_TECNAI_PREFIXES``) in a single pass over the
+    string, mapping each prefix to the rest of the first line that starts
+    with it
+    """
+    index = {}
+    for match in _tecnai_line_pattern(delimiter).finditer(tecnai_info):
+        index.setdefault(match.group(1), match.group(2))
+    return index
+
+
+def _tecnai_extract(pattern: Pattern, str_to_search: Optional[str],
+                    match_num: int = 1) -> Optional[str]:
+    """Extract a value from a string based on a grouped, compiled regex. If
+    the string is ``None`` (i.e. the line was not found), return ``None``
+    without searching
+    """
+    if str_to_search is None:
+        return None
+    result = pattern.search(str_to_search)
+    if result is not None:
+        result = result[match_num]
+    return result
+
+
 class ElectronMicroscopyParser(BaseSingleFileParser):
     """Parse metadata specific to electron microscopy, meaning any file
     supported by HyperSpy's I/O capabilities. Extract both the metadata
@@ -29,39 +509,61 @@ class ElectronMicroscopyParser(BaseSingleFileParser):
     
     The allowed metadata values are controlled by the
     ../schemas/electron_microscopy.json JSONSchema specification
+
+    The context dictionary for this parser includes one field:
+        - ``include_raw_metadata``: Whether to include the full original
+        metadata tree of the file as ``raw_metadata`` (default: ``True``)
     """
 
     def _parse_file(self, file_path: str, context: Dict = None) -> Dict:
         self.em = {}
         self.inst_data = None
 
-        # Read file lazily (reduce memory), both HyperSpy-formatted and raw data
-        self.hs_data = hs_load(file_path, lazy=True)
-
-        # if hs_data is a list, pull out first for metadata extraction
-        if isinstance(self.hs_data, list):
-            self.hs_data = self.hs_data[0]
-
-        self.meta = self.hs_data.metadata.as_dictionary()
-        self.raw_meta = self.hs_data.original_metadata.as_dictionary()
-        self.em['raw_metadata'] = self.raw_meta
-
-        for s in ['General', 'General_EM', 'TEM', 'SEM', 'EDS', 'EELS']:
-            self.em[s] = {}
-
-        # call each individual processor
-        self._process_hs_data()
-        self._dm3_general_info()
-        self._dm3_eels_info()
-        self._dm3_tecnai_info()
-        self._dm3_eds_info()
-        self._tia_info()
-        self._tiff_info()
+        try:
+            # Read file lazily (reduce memory), both HyperSpy-formatted and
+            # raw data
+            self.hs_data = hs_load(file_path, lazy=True)
+
+            # if hs_data is a list, pull out first for metadata extraction
+            if isinstance(self.hs_data, list):
+                self.hs_data = self.hs_data[0]
+
+            self.meta = self.hs_data.metadata.as_dictionary()
+            self.raw_meta = self.hs_data.original_metadata.as_dictionary()
+            if context is None:
+                context = dict()
+            if context.get('include_raw_metadata', True):
+                self.em['raw_metadata'] = self.raw_meta
+
+            # DM3 tags subtree depends on raw_meta; resolved on first use
+            self._dm3_tags = None
+
+            for s in ['General', 'General_EM', 'TEM', 'SEM', 'EDS', 'EELS']:
+                self.em[s] = {}
+
+            # call each individual processor; the format-specific ones only
+            # read tags under a single top-level group, so skip them if it is
+            # missing
+            self._process_hs_data()
+            if 'ImageList' in self.raw_meta:
+                self._dm3_general_info()
+                self._dm3_eels_info()
+                self._dm3_tecnai_info()
+                self._dm3_eds_info()
+            if 'ObjectInfo' in self.raw_meta:
+                self._tia_info()
+            if 'fei_metadata' in self.raw_meta:
+                self._tiff_info()
+        finally:
+            # a parser instance is reused across files, so release the signal
+            # (and the lazily-opened file behind it) and the metadata trees
+            # (and subtrees of them), even if a processor failed
+            self.hs_data = self.inst_data = self.tecnai_info = None
+            self.meta = self.raw_meta = self._dm3_tags = None
 
         # Remove None/empty values
-        for key, val in list(self.em.items()):
-            if val is None or val == [] or val == {}:
-                self.em.pop(key)
+        self.em = {key: val for key, val in self.em.items()
+                   if val is not None and val != [] and val != {}}
 
         record = {}
         if self.em:
@@ -69,164 +571,71 @@ class ElectronMicroscopyParser(BaseSingleFileParser):
 
         return record
 
+    def parse_many(self, file_paths: Iterable[str], context: Dict = None,
+                   max_workers: Optional[int] = None) -> Iterator[Dict]:
+        """Parse many files in parallel, each in a separate worker process
+
+        ``file_paths`` is consumed lazily: at most ``2 * max_workers`` files
+        are submitted ahead of the record that is being yielded, so neither
+        the paths nor the parsed records are all held in memory at once. If
+        the caller stops iterating early (or an error is raised), the files
+        that have not started parsing are cancelled, and only those already
+        handed to a worker are waited for.
+
+        Args:
+            file_paths: Paths of the files to parse
+            context: Context about the files, passed to each call of
+                :meth:`parse`
+            max_workers: Maximum number of worker processes to use; if
+                ``None``, defaults to the number of processors on the machine
+
+        Yields:
+            The metadata for each file, in the same order as ``file_paths``
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        file_paths = iter(file_paths)
+        parser_cls = type(self)
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        pending = deque()
+        try:
+            for file_path in islice(file_paths, 2 * max_workers):
+                pending.append(executor.submit(_parse_in_worker, parser_cls,
+                                               file_path, context))
+            while pending:
+                record = pending.popleft().result()
+                # keep the window full while the caller handles this record
+                for file_path in islice(file_paths, 1):
+                    pending.append(executor.submit(
+                        _parse_in_worker, parser_cls, file_path, context))
+                yield record
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def _process_hs_data(self) -> None:
         """Parse metadata that was already extracted from HyperSpy"""
+        meta, em = self.meta, self.em
+
         # Image mode is SEM, TEM, or STEM
         # STEM is a subset of TEM
-        if "SEM" in self.meta.get('Acquisition_instrument', {}).keys():
+        acq = get_val(meta, ('Acquisition_instrument',))
+        if acq is not None and "SEM" in acq:
             self.inst = "SEM"
-        elif "TEM" in self.meta.get('Acquisition_instrument', {}).keys():
+        elif acq is not None and "TEM" in acq:
             self.inst = "TEM"
         else:
             self.inst = 'None'
 
         # HS data
-        self.inst_data = get_val(self.meta, ('Acquisition_instrument',
-                                             self.inst))
+        self.inst_data = get_val(acq, (self.inst,))
         if self.inst_data is not None:
-            source = self.inst_data
-            dest = self.em
-            mapping = [
-                MappingElements(
-                    source_dict=source, source_path='acquisition_mode',
-                    dest_dict=dest, dest_path=('General_EM',
-                                               'acquisition_mode'),
-                    cast_fn=str, units=None, conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, source_path='beam_current',
-                    dest_dict=dest, dest_path=('General_EM', 'beam_current'),
-                    cast_fn=float, units='NanoA', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, source_path='beam_energy',
-                    dest_dict=dest, dest_path=('General_EM', 'beam_energy'),
-                    cast_fn=float, units='KiloEV', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path='convergence_angle',
-                    dest_dict=dest, dest_path=('General_EM',
-                                               'convergence_angle'),
-                    cast_fn=float, units='MilliRAD', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path='magnification',
-                    dest_dict=dest, dest_path=('General_EM',
-                                               'magnification_indicated'),
-                    cast_fn=float, units='UNITLESS', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path='microscope',
-                    dest_dict=dest, dest_path=('General_EM', 'microscope_name'),
-                    cast_fn=str, units=None, conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source, source_path='probe_area',
-                    dest_dict=dest, dest_path=('General_EM', 'probe_area'),
-                    cast_fn=float, units='NanoM2', conv_fn=None,
-                    override=False),
-
-                # stage positions
-                MappingElements(
-                    source_dict=source,
-                    source_path=('Stage', 'rotation'),
-                    dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'rotation'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source,
-                    source_path=('Stage', 'tilt_alpha'),
-                    dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source,
-                    source_path=('Stage', 'tilt_beta'),
-                    dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=source,
-                    dest_dict=dest,
-                    source_path=('Stage', 'x'),
-                    dest_path=('General_EM', 'stage_position', 'x'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source,
-                    source_path=('Stage', 'y'),
-                    dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'y'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source,
-                    source_path=('Stage', 'z'),
-                    dest_dict=dest,
-                    dest_path=('General_EM', 'stage_position', 'z'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-
-                # camera length/working distance
-                MappingElements(
-                    source_dict=source, source_path='camera_length',
-                    dest_dict=dest, dest_path=('TEM', 'camera_length'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=source, source_path='working_distance',
-                    dest_dict=dest, dest_path=('SEM', 'working_distance'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False)]
-
-            map_dict_values(mapping)
+            map_table_values(self.inst_data, em, _HS_INST_MAPPINGS)
 
             self._process_hs_detectors()
 
-        source = self.meta
-        dest = self.em
-        mapping = [
-            # Elements present (if known)
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('Sample', 'elements'),
-                dest_path=('General_EM', 'elements'),
-                cast_fn=list, units=None, conv_fn=None, override=False),
-            # General metadata
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'date'),
-                dest_path=('General', 'date'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'doi'),
-                dest_path=('General', 'doi'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'original_filename'),
-                dest_path=('General', 'original_filename'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'notes'),
-                dest_path=('General', 'notes'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'time'),
-                dest_path=('General', 'time'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'time_zone'),
-                dest_path=('General', 'time_zone'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=source, dest_dict=dest,
-                source_path=('General', 'title'),
-                dest_path=('General', 'title'),
-                cast_fn=str, units=None, conv_fn=None, override=False)]
-
-        map_dict_values(mapping)
+        map_table_values(meta, em, _HS_GENERAL_MAPPINGS)
         self._process_hs_axes()
 
     def _process_hs_axes(self) -> None:
@@ -251,458 +660,96 @@ class ElectronMicroscopyParser(BaseSingleFileParser):
             if 'units' in v:
                 axes[k]['units'] = standardize_unit(axes[k]['units'])
 
-        self.em['General']['axis_calibration'] = axes
-        self.em['General']['data_dimensions'] = \
-            [v['size'] for v in
-             self.hs_data.axes_manager.as_dictionary().values()]
+        general = self.em['General']
+        general['axis_calibration'] = axes
+        general['data_dimensions'] = [v['size'] for v in axes.values()]
 
     def _process_hs_detectors(self) -> None:
         """Parses HyperSpy-formatted metadata specific to detectors as
         specified by http://hyperspy.org/hyperspy-doc/current/user_guide
         /metadata_structure.html
         """
-        detector_node = get_val(self.inst_data, 'Detector')
-        dest_dict = self.em
-        mapping = [
-            MappingElements(
-                source_dict=self.inst_data, source_path='detector_type',
-                dest_dict=dest_dict, dest_path=('General_EM', 'detector_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False
-            )
-        ]
-
-        if detector_node is not None:
-            mapping += [
-                # EDS
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EDS', 'azimuth_angle'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'azimuth_angle'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EDS', 'elevation_angle'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'elevation_angle'),
-                    cast_fn=float, units='DEG', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EDS', 'energy_resolution_MnKa'),
-                    dest_dict=dest_dict,
-                    dest_path=('EDS', 'energy_resolution_MnKa'),
-                    cast_fn=float, units='EV', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EDS', 'live_time'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'live_time'),
-                    cast_fn=float, units='SEC', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node, source_path=('EDS', 'real_time'),
-                    dest_dict=dest_dict, dest_path=('EDS', 'real_time'),
-                    cast_fn=float, units='SEC', conv_fn=None, override=False),
-
-                # EELS
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EELS', 'aperture_size'),
-                    dest_dict=dest_dict, dest_path=('EELS', 'aperture_size'),
-                    cast_fn=float, units='MilliM', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EELS', 'collection_angle'),
-                    dest_dict=dest_dict, dest_path=('EELS', 'collection_angle'),
-                    cast_fn=float, units='MilliRAD', conv_fn=None,
-                    override=False),
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EELS', 'dwell_time'),
-                    dest_dict=dest_dict, dest_path=('General_EM', 'dwell_time'),
-                    cast_fn=float, units='SEC', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EELS', 'exposure'),
-                    dest_dict=dest_dict,
-                    dest_path=('General_EM', 'exposure_time'),
-                    cast_fn=float, units='SEC', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EELS', 'frame_number'),
-                    dest_dict=dest_dict,
-                    dest_path=('EELS', 'number_of_samples'),
-                    cast_fn=int, units='NUM', conv_fn=None, override=False),
-                MappingElements(
-                    source_dict=detector_node,
-                    source_path=('EELS', 'spectrometer'),
-                    dest_dict=dest_dict,
-                    dest_path=('EELS', 'spectrometer_name'),
-                    cast_fn=str, units=None, conv_fn=None, override=False),
-            ]
-        map_dict_values(mapping)
+        inst_data = self.inst_data
+        if inst_data is None:
+            return
+
+        set_val_units(self.em, ('General_EM', 'detector_name'),
+                      get_val(inst_data, ('detector_type',), str))
+
+        detector = get_val(inst_data, ('Detector',))
+        if detector is None:
+            return
+        map_table_values(detector, self.em, _HS_DETECTOR_MAPPINGS)
 
     def _dm3_general_info(self) -> None:
         """Parse commonly-found TEM-related tags in DigitalMicrograph files"""
-        # process "Microscope Info"
-        base = self.__get_dm3_tag_pre_path() + ('Microscope Info',)
-        dest_dict = self.em
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Indicated Magnification',),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'magnification_indicated'),
-                cast_fn=float, units='UNITLESS', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Actual Magnification',),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'magnification_actual'),
-                cast_fn=float, units='UNITLESS', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Cs(mm)',),
-                dest_dict=dest_dict,
-                dest_path=('TEM', 'spherical_aberration_coefficient'),
-                cast_fn=float, units='MilliM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('STEM Camera Length',),
-                dest_dict=dest_dict,
-                dest_path=('TEM', 'camera_length'),
-                cast_fn=float, units='MilliM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Operation Mode',),
-                dest_dict=dest_dict, dest_path=('TEM', 'operation_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Imaging Mode',),
-                dest_dict=dest_dict, dest_path=('TEM', 'imaging_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Illumination Mode',),
-                dest_dict=dest_dict, dest_path=('TEM', 'illumination_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Microscope',),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'microscope_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Stage Position', 'Stage X'),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'stage_position', 'x'),
-                cast_fn=float, units='MilliM', conv_fn=lambda x: x/1000,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Stage Position', 'Stage Y'),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'stage_position', 'y'),
-                cast_fn=float, units='MilliM', conv_fn=lambda x: x / 1000,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Stage Position', 'Stage Z'),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'stage_position', 'z'),
-                cast_fn=float, units='MilliM', conv_fn=lambda x: x / 1000,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Stage Position', 'Stage Alpha'),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                cast_fn=float, units='DEG', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Stage Position', 'Stage Beta'),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                cast_fn=float, units='DEG', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Emission Current (µA)',),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'emission_current'),
-                cast_fn=float, units='MicroA', conv_fn=None, override=False),
-        ]
-
-        voltage = get_val(self.raw_meta, base + ('Voltage',), float)
+        em = self.em
+        tags, is_dm3 = self.__get_dm3_tags()
+        for section, table in _DM3_GENERAL_SECTIONS:
+            map_table_values(tags, em, table, section)
+
+        voltage = get_val(tags, ('Microscope Info', 'Voltage'), float)
         if voltage is not None:
-            mapping += [
-                MappingElements(
-                    source_dict=self.raw_meta, dest_dict=dest_dict,
-                    source_path=base + ('Voltage',), cast_fn=float,
-                    dest_path=('General_EM', 'accelerating_voltage'),
-                    units='KiloV' if voltage >= 1000 else 'V',
-                    conv_fn=lambda x: x / 1000 if voltage >= 1000 else x,
-                    override=False)
-            ]
-
-        # "Session Info"
-        base = self.__get_dm3_tag_pre_path() + ('Session Info',)
-        mapping += [
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Detector',),
-                dest_dict=dest_dict, dest_path=('General_EM', 'detector_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, source_path=base + ('Microscope',),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'microscope_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False)]
-
-        # "Meta Data"
-        base = self.__get_dm3_tag_pre_path() + ('Meta Data',)
-        mapping += [
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Acquisition Mode',),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Format',),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_format'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Signal',),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_signal'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            # sometimes the EDS signal label is in a different place
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Experiment keywords', 'TagGroup1',
-                                    'Label'),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_signal'),
-                cast_fn=str, units=None, conv_fn=None, override=False)
-        ]
-
-        # a few miscellaneous DM tags:
-        base = self.__get_dm3_tag_pre_path()
-        mapping += [
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Acquisition', 'Device', 'Name'),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_device'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('DataBar', 'Device Name'),
-                dest_dict=dest_dict, dest_path=('TEM', 'acquisition_device'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('Acquisition', 'Parameters', 'High Level',
-                                    'Exposure (s)'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'exposure_time'),
-                cast_fn=float, units='SEC', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('DataBar', 'Exposure Time (s)'),
-                dest_dict=dest_dict, dest_path=('General_EM', 'exposure_time'),
-                cast_fn=float, units='SEC', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=base + ('GMS Version', 'Created'),
-                dest_dict=dest_dict,
-                dest_path=('General_EM', 'acquisition_software_version'),
-                cast_fn=str, units=None, conv_fn=None, override=False)
-        ]
-
-        if get_val(self.raw_meta, ('ImageList', 'TagGroup0', 'ImageTags')) is\
-                not None:
+            units, conv_fn = _VOLT_HIGH if voltage >= 1000 else _VOLT_LOW
+            set_val_units(em, ('General_EM', 'accelerating_voltage'),
+                          voltage, units, fn=conv_fn)
+
+        if is_dm3:
             # we have DigitalMicrograph tags, so set acquisition software name
-            set_val_units(nest_dict=dest_dict,
+            set_val_units(nest_dict=em,
                           path=('General_EM', 'acquisition_software_name'),
                           value='DigitalMicrograph')
 
-        map_dict_values(mapping)
-
-    def __get_dm3_tag_pre_path(self) -> Tuple:
-        """Get the path into a dictionary where the important DigitalMicrograph
-        metadata is expected to be found. If the .dm3/.dm4 file contains a stack
-        of images, the metadata to extract is instead under a `plane info`
-        tag, so this method will determine if the stack metadata is present
-        and return the correct path. ``pre_path`` will be something
-        like ``('ImageList', 'TagGroup0', 'ImageTags', 'plane info',
-        'TagGroup0', 'source tags')``.
+    def __get_dm3_tags(self) -> Tuple[Optional[Dict], bool]:
+        """Get the subtree of the ``raw_metadata`` where the important
+        DigitalMicrograph metadata is expected to be found. If the .dm3/.dm4
+        file contains a stack of images, the metadata to extract is instead
+        under a `plane info` tag, so this method will determine if the stack
+        metadata is present and return the correct subtree (found at
+        ``('ImageList', 'TagGroup0', 'ImageTags', 'plane info', 'TagGroup0',
+        'source tags')``). The result is cached for the file currently being
+        parsed.
 
         Returns:
-            A tuple containing the subsequent keys that need to be traversed
-            to get to the point in the ``raw_metadata`` where the important
-            metadata is stored
+            A tuple of ``(tags, is_dm3)``, where ``tags`` is the dictionary
+            in which the important metadata is stored (or ``None`` if it is
+            not present), and ``is_dm3`` is whether the file has
+            DigitalMicrograph image tags at all
         """
+        if self._dm3_tags is not None:
+            return self._dm3_tags
+
+        image_tags = get_val(self.raw_meta, _DM3_IMAGE_TAGS)
         # test if we have a stack
-        stack_path = ('ImageList', 'TagGroup0', 'ImageTags', 'plane info')
-        stack_val = get_val(self.raw_meta, stack_path)
-        if stack_val is not None:
-            # we're in a stack
-            pre_path = ('ImageList', 'TagGroup0', 'ImageTags', 'plane info',
-                        'TagGroup0', 'source tags')
+        if get_val(image_tags, ('plane info',)) is not None:
+            # we're in a stack (so the image tags are certainly present)
+            self._dm3_tags = (get_val(image_tags, _DM3_STACK_TAGS), True)
         else:
-            pre_path = ('ImageList', 'TagGroup0', 'ImageTags')
+            self._dm3_tags = (image_tags, image_tags is not None)
 
-        return pre_path
+        return self._dm3_tags
 
     def _dm3_eels_info(self) -> None:
         """Parse EELS-related information from Gatan DigitalMicrograph format
         """
+        em = self.em
+
         # basic EELS metadata
-        pre_path = self.__get_dm3_tag_pre_path()
-        base = pre_path + ('EELS', )
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Acquisition', 'Exposure (s)'),
-                dest_path=('General_EM', 'exposure_time'), units='SEC',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Acquisition', 'Integration time (s)'),
-                dest_path=('EELS', 'integration_time'), units='SEC',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Acquisition', 'Number of frames'),
-                dest_path=('EELS', 'number_of_samples'), units='NUM',
-                conv_fn=None, cast_fn=int, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Experimental Conditions',
-                                    'Collection semi-angle (mrad)'),
-                dest_path=('EELS', 'collection_angle'), units='MilliRAD',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Experimental Conditions',
-                                    'Convergence semi-angle (mrad)'),
-                dest_path=('General_EM', 'convergence_angle'), units='MilliRAD',
-                conv_fn=None, cast_fn=float, override=False)]
+        tags, _ = self.__get_dm3_tags()
+        map_table_values(tags, em, _DM3_EELS_MAPPINGS, ('EELS',))
 
         # spectrometer metadata
         # is usually at one of two places, so try both
-        spect_dict = get_val(self.raw_meta,
-                             pre_path + ('EELS', 'Acquisition', 'Spectrometer'))
-        if spect_dict is not None:
-            spect_path = pre_path + ('EELS', 'Acquisition', 'Spectrometer')
-        else:
-            spect_path = pre_path + ('EELS Spectrometer',)
-        mapping += [
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Aperture label',),
-                dest_path=('EELS', 'aperture_size'), units='MilliM',
-                conv_fn=None,
-                cast_fn=lambda s: float(s.replace('mm', '')),
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Dispersion (eV/ch)',),
-                dest_path=('EELS', 'dispersion_per_channel'), units='EV',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Energy loss (eV)',),
-                dest_path=('EELS', 'energy_loss_offset'), units='EV',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Instrument name',),
-                dest_path=('EELS', 'spectrometer_name'), units=None,
-                conv_fn=None, cast_fn=str, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Drift tube voltage (V)',),
-                dest_path=('EELS', 'drift_tube_voltage'), units='V',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Drift tube enabled',),
-                dest_path=('EELS', 'drift_tube_enabled'), units=None,
-                conv_fn=None, cast_fn=bool, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Prism offset (V)',),
-                dest_path=('EELS', 'prism_shift_voltage'), units='V',
-                conv_fn=None, cast_fn=float, override=False),
-            # note space at end of "Prism offset enabled " because that's how
-            # it gets loaded in from DigitalMicrograph...
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Prism offset enabled ',),
-                dest_path=('EELS', 'prism_shift_enabled'), units=None,
-                conv_fn=None, cast_fn=bool, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Slit width (eV)',),
-                dest_path=('EELS', 'filter_slit_width'), units='EV',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=spect_path + ('Slit inserted',),
-                dest_path=('EELS', 'filter_slit_inserted'), units=None,
-                conv_fn=None, cast_fn=bool, override=False),
-        ]
-        map_dict_values(mapping)
+        spect_path, alt_spect_path = _DM3_EELS_SPECTROMETER_PATHS
+        spectrometer = get_val(tags, spect_path)
+        if spectrometer is None:
+            spectrometer = get_val(tags, alt_spect_path)
+        map_table_values(spectrometer, em, _DM3_EELS_SPECTROMETER_MAPPINGS)
 
     def _dm3_eds_info(self) -> None:
         """Parse EDS-related information from Gatan DigitalMicrograph format"""
-        pre_path = self.__get_dm3_tag_pre_path()
-        base = pre_path + ('EDS',)
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Azimuthal angle'),
-                dest_path=('EDS', 'azimuth_angle'), units='DEG',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Detector type'),
-                dest_path=('EDS', 'detector_type'), units=None,
-                conv_fn=None, cast_fn=str, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Acquisition', 'Dispersion (eV)'),
-                dest_path=('EDS', 'dispersion_per_channel'), units='EV',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Elevation angle'),
-                dest_path=('EDS', 'elevation_angle'), units='DEG',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Incidence angle'),
-                dest_path=('EDS', 'incidence_angle'), units='DEG',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Live time',),
-                dest_path=('EDS', 'live_time'), units='SEC',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Real time',),
-                dest_path=('EDS', 'real_time'), units='SEC',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Solid angle'),
-                dest_path=('EDS', 'solid_angle'), units='SR',
-                conv_fn=None, cast_fn=float, override=False),
-            MappingElements(
-                source_dict=self.raw_meta, dest_dict=self.em,
-                source_path=base + ('Detector Info', 'Stage tilt'),
-                dest_path=('EDS', 'stage_tilt'), units='DEG',
-                conv_fn=None, cast_fn=float, override=False)
-        ]
-
-        map_dict_values(mapping)
+        tags, _ = self.__get_dm3_tags()
+        map_table_values(tags, self.em, _DM3_EDS_MAPPINGS, ('EDS',))
 
     def _dm3_tecnai_info(self, delimiter: Optional[str] = u'\u2028') -> None:
         """Some FEI Microscopes will write additional metadata into dm3 files
@@ -712,36 +759,11 @@ class ElectronMicroscopyParser(BaseSingleFileParser):
         implementation in https://github.com/usnistgov/NexusLIMS
 
         args:
-            delimiter: The value (a unicode string) used to split the
-                ``microscope_info`` string. Should not need to be provided (
+            delimiter: The value (a unicode string) separating the lines of
+                the ``microscope_info`` string. Should not need to be provided (
                 this value is hard-coded in DigitalMicrograph), but specified
                 as a parameter for future flexibility
         """
-        def __find_val(s_to_find, list_to_search):
-            """Return the first value in ``list_to_search`` that contains
-            ``s_to_find``, or ``None`` if it is not found
-
-            Note: If needed, this could be improved to use regex instead,
-            which would provide more control over the patterns to return
-            """
-            res = [x for x in list_to_search if s_to_find in x]
-            if len(res) > 0:
-                res = res[0]
-                # remove the string we searched for from the beginning of
-                # the res
-                return re.sub("^" + s_to_find, "", res)
-            else:
-                return None
-
-        def __extract_val(regex: str, str_to_search: str,
-                          match_num : int = 1) -> Optional[str]:
-            """Extract a value from a string based on a grouped regex
-            """
-            result = re.compile(regex).search(str_to_search)
-            if result is not None:
-                result = result[match_num]
-            return result
-
         path_to_tecnai = ('ImageList', 'TagGroup0', 'ImageTags', 'Tecnai',
                           'Microscope Info')
         self.tecnai_info = get_val(self.raw_meta, path_to_tecnai)
@@ -750,184 +772,71 @@ class ElectronMicroscopyParser(BaseSingleFileParser):
             # if tecnai info is not present, return early to save some work
             return
         else:
-            # split the tecnai_info string into a list
-            self.tecnai_info = self.tecnai_info.split(delimiter)
-
-            # we override existing values since Tecnai info is more specific
-            mapping = [
-                MappingElements(
-                    source_dict={
-                        'Microscope_Name': __find_val('Microscope ',
-                                                      self.tecnai_info)},
-                    source_path='Microscope_Name', dest_dict=self.em,
-                    dest_path=('General_EM', 'microscope_name'), cast_fn=str,
-                    units=None, conv_fn=None, override=True),
-                MappingElements(
-                    source_dict={
-                        'Extractor_Voltage':
-                            __extract_val(r'Extr volt (\d*) V',
-                                          __find_val('Extr volt ',
-                                                     self.tecnai_info))},
-                    source_path='Extractor_Voltage', dest_dict=self.em,
-                    dest_path=('TEM', 'extractor_voltage'), cast_fn=int,
-                    units='V', conv_fn=None, override=True),
-                MappingElements(
-                    source_dict={
-                        'Emission_Current':
-                            __extract_val(r'Emission ([\d|\.]*)uA',
-                                          __find_val('Emission ',
-                                                     self.tecnai_info))},
-                    source_path='Emission_Current', dest_dict=self.em,
-                    dest_path=('General_EM', 'emission_current'), cast_fn=float,
-                    units='MicroA', conv_fn=None, override=True),
-                MappingElements(
-                    source_dict={
-                        'Operation_Mode':
-                            __extract_val(r'(.*) Defocus',
-                                          __find_val('Mode ',
-                                                     self.tecnai_info))},
-                    source_path='Operation_Mode', dest_dict=self.em,
-                    dest_path=('TEM', 'operation_mode'), cast_fn=str,
-                    units=None, conv_fn=None, override=True),
-
+            # index the lines of the tecnai_info string by their prefix
+            tecnai_lines = _tecnai_index(self.tecnai_info, delimiter)
+            # several values are extracted from each of these lines
+            gun_line = tecnai_lines.get('Gun ')
+            mode_line = tecnai_lines.get('Mode ')
+            patterns = _tecnai_patterns()
+            em = self.em
+
+            # extract every value of interest into one dictionary
+            tecnai_vals = {
+                'Microscope_Name': tecnai_lines.get('Microscope '),
+                'Extractor_Voltage': _tecnai_extract(patterns['extr_volt'],
+                                                     gun_line),
+                'Emission_Current': _tecnai_extract(patterns['emission'],
+                                                    gun_line),
+                'Operation_Mode': _tecnai_extract(patterns['operation_mode'],
+                                                  mode_line),
                 # try two different extractions of defocus for mag mode and
                 # diffraction mode:
-                MappingElements(
-                    source_dict={
-                        'Defocus':
-                            __extract_val(r'Defocus \(um\) (.*) Magn',
-                                          __find_val('Mode ',
-                                                     self.tecnai_info))},
-                    source_path='Defocus', dest_dict=self.em,
-                    dest_path=('TEM', 'defocus'), cast_fn=float,
-                    units='MicroM', conv_fn=None, override=True),
-                MappingElements(
-                    source_dict={
-                        'Defocus':
-                            __extract_val(r'Defocus ([\d|\.]*) CL',
-                                          __find_val('Mode ',
-                                                     self.tecnai_info))},
-                    source_path='Defocus', dest_dict=self.em,
-                    dest_path=('TEM', 'defocus'), cast_fn=float,
-                    units='MicroM', conv_fn=None, override=True),
+                'Defocus_Mag': _tecnai_extract(patterns['defocus_mag'],
+                                               mode_line),
+                'Defocus_Diff': _tecnai_extract(patterns['defocus_diff'],
+                                                mode_line),
                 # try magnification (not always present):
-                MappingElements(
-                    source_dict={
-                        'Magnification':
-                            __extract_val(r'Magn (\d*)x',
-                                          __find_val('Mode ',
-                                                     self.tecnai_info))},
-                    source_path='Magnification', dest_dict=self.em,
-                    dest_path=('General_EM', 'magnification_indicated'),
-                    cast_fn=int, units='UNITLESS', conv_fn=None,
-                    override=True),
-                MappingElements(
-                    source_dict={
-                        'Camera_Length':
-                            __extract_val(r'CL (.*)m',
-                                          __find_val('Mode ',
-                                                     self.tecnai_info))},
-                    source_path='Camera_Length', dest_dict=self.em,
-                    dest_path=('TEM', 'camera_length'), cast_fn=float,
-                    units='MilliM', conv_fn=lambda x: x*1000, override=True),
+                'Magnification': _tecnai_extract(patterns['magnification'],
+                                                 mode_line),
+                'Camera_Length': _tecnai_extract(patterns['camera_length'],
+                                                 mode_line),
                 # spot size
-                MappingElements(
-                    source_dict={'Spot_Size':
-                                     __find_val('Spot ', self.tecnai_info)},
-                    source_path='Spot_Size', dest_dict=self.em,
-                    dest_path=('TEM', 'spot_size'), cast_fn=int,
-                    units='UNITLESS', conv_fn=None, override=True),
+                'Spot_Size': tecnai_lines.get('Spot '),
                 # Tecnai has info about apertures and lens strengths,
                 # but not extracting here (see NexusLIMS code for example)
-            ]
-            stage_vals = __find_val('Stage', self.tecnai_info)
+            }
+
+            stage_vals = tecnai_lines.get('Stage')
             if stage_vals:
-                x, y, z = re.findall(r' (-?\d*\.\d*) um', stage_vals)
-                alpha, beta = re.findall(r' (-?\d*\.\d*) deg', stage_vals)
-                stage = {'x': x, 'y': y, 'z': z, 'a': alpha, 'b': beta}
-                mapping += [
-                    MappingElements(
-                        source_dict=stage, source_path='x', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'x'),
-                        cast_fn=float, units='MicroM', conv_fn=None,
-                        override=True),
-                    MappingElements(
-                        source_dict=stage, source_path='y', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'y'),
-                        cast_fn=float, units='MicroM', conv_fn=None,
-                        override=True),
-                    MappingElements(
-                        source_dict=stage, source_path='z', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'z'),
-                        cast_fn=float, units='MicroM', conv_fn=None,
-                        override=True),
-                    MappingElements(
-                        source_dict=stage, source_path='a', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position',
-                                   'tilt_alpha'), cast_fn=float, units='DEG',
-                        conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=stage, source_path='b', dest_dict=self.em,
-                        dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                        cast_fn=float, units='DEG', conv_fn=None,
-                        override=True),
-                ]
+                x, y, z, alpha, beta = patterns['stage'].findall(stage_vals)
+                tecnai_vals.update(Stage_X=x, Stage_Y=y, Stage_Z=z,
+                                   Stage_A=alpha, Stage_B=beta)
 
             # process EELS spectrometer info from Tecnai string
-            if __find_val('Filter related settings', self.tecnai_info):
-                filter_dict = {
-                    'Mode': __find_val('Mode: ', self.tecnai_info),
-                    'Dispersion': __extract_val(
-                        r'(.*)\[eV/Channel\]',
-                        __find_val('Selected dispersion: ', self.tecnai_info)),
-                    'Aperture': __extract_val(
-                        r'(\d*)mm', __find_val('Selected aperture: ',
-                                               self.tecnai_info)),
-                    'Prism': __extract_val(
-                        r'(.*)\[eV\]',
-                        __find_val('Prism shift: ', self.tecnai_info)),
-                    'Drift': __extract_val(
-                        r'(.*)\[eV\]',
-                        __find_val('Drift tube: ', self.tecnai_info)),
-                    'TotalLoss': __extract_val(
-                        r'(.*)\[eV\]',
-                        __find_val('Total energy loss: ', self.tecnai_info))
-                }
-                mapping += [
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Mode',
-                        dest_dict=self.em,
-                        dest_path=('EELS', 'spectrometer_mode'),
-                        cast_fn=str, units=None, conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Dispersion',
-                        dest_dict=self.em,
-                        dest_path=('EELS', 'dispersion_per_channel'),
-                        cast_fn=float, units='EV', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Aperture',
-                        dest_dict=self.em,
-                        dest_path=('EELS', 'aperture_size'),
-                        cast_fn=float, units='MilliM', conv_fn=None,
-                        override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Drift',
-                        dest_dict=self.em, dest_path=('EELS',
-                                                      'drift_tube_energy'),
-                        cast_fn=float, units='EV', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='Prism',
-                        dest_dict=self.em, dest_path=('EELS',
-                                                      'prism_shift_energy'),
-                        cast_fn=float, units='EV', conv_fn=None, override=True),
-                    MappingElements(
-                        source_dict=filter_dict, source_path='TotalLoss',
-                        dest_dict=self.em, dest_path=('EELS',
-                                                      'total_energy_loss'),
-                        cast_fn=float, units='EV', conv_fn=None, override=True),
-                ]
-
-            map_dict_values(mapping)
+            if tecnai_lines.get('Filter related settings'):
+                tecnai_vals.update({
+                    'Filter_Mode': tecnai_lines.get('Mode: '),
+                    'Filter_Dispersion': _tecnai_extract(
+                        patterns['dispersion'],
+                        tecnai_lines.get('Selected dispersion: ')),
+                    'Filter_Aperture': _tecnai_extract(
+                        patterns['aperture'],
+                        tecnai_lines.get('Selected aperture: ')),
+                    'Filter_Prism': _tecnai_extract(
+                        patterns['ev'],
+                        tecnai_lines.get('Prism shift: ')),
+                    'Filter_Drift': _tecnai_extract(
+                        patterns['ev'],
+                        tecnai_lines.get('Drift tube: ')),
+                    'Filter_TotalLoss': _tecnai_extract(
+                        patterns['ev'],
+                        tecnai_lines.get('Total energy loss: '))
+                })
+
+            # we override existing values since Tecnai info is more specific
+            for table in (_TECNAI_MAPPINGS, _TECNAI_STAGE_MAPPINGS,
+                          _TECNAI_FILTER_MAPPINGS):
+                map_table_values(tecnai_vals, em, table, override=True)
 
     def _tia_info(self) -> None:
         """Parses information commonly found in .ser/.emi files produced by the
@@ -937,311 +846,18 @@ class ElectronMicroscopyParser(BaseSingleFileParser):
         non-specific as to acqusition modality (i.e. could be EELS or EDS), so
         we do not extract those into our metadata hierarchy 
         """
-
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalConditions',
-                             'MicroscopeConditions', 'AcceleratingVoltage'),
-                dest_dict=self.em, dest_path=('General_EM',
-                                              'accelerating_voltage'),
-                cast_fn=float, units='V', conv_fn=None, override=False),
-
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'AcquireInfo', 'DwellTimePath'),
-                dest_dict=self.em, dest_path=('General_EM', 'dwell_time'),
-                cast_fn=float, units='SEC', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'AcquireInfo', 'FrameTime'),
-                dest_dict=self.em, dest_path=('General_EM', 'frame_time'),
-                cast_fn=float, units='SEC', conv_fn=None, override=False),
-
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'Microscope'),
-                dest_dict=self.em, dest_path=('General_EM', 'microscope_name'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'High tension_kV'),
-                dest_dict=self.em, dest_path=('General_EM',
-                                              'accelerating_voltage'),
-                cast_fn=float, units='KiloV', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'Emission_uA'), dest_dict=self.em,
-                dest_path=('General_EM', 'emission_current'),
-                cast_fn=float, units='MicroA', conv_fn=None, override=False),
-            # this value is often more specific than the one from HyperSpy,
-            # so override acquisition mode:
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription', 'Mode'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'acquisition_mode'),
-                cast_fn=str, units=None, conv_fn=lambda x: x.strip(),
-                override=True),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'Defocus_um'),
-                dest_dict=self.em, dest_path=('TEM', 'defocus'),
-                cast_fn=float, units='MicroM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'Magnification_x'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'magnification_indicated'),
-                cast_fn=float, units='UNITLESS', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'Camera length_m'),
-                dest_dict=self.em, dest_path=('TEM', 'camera_length'),
-                cast_fn=float, units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('ObjectInfo', 'ExperimentalDescription',
-                             'Spot size'),
-                dest_dict=self.em, dest_path=('TEM', 'spot_size'),
-                cast_fn=int, units='UNITLESS', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription', 'Stage X_um'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'x'),
-                cast_fn=float, units='MicroM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription', 'Stage Y_um'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'y'),
-                cast_fn=float, units='MicroM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription', 'Stage Z_um'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'z'),
-                cast_fn=float, units='MicroM', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription', 'Stage A_deg'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                cast_fn=float, units='DEG', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription', 'Stage B_deg'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                cast_fn=float, units='DEG', conv_fn=None, override=False),
-
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription', 'Filter mode'),
-                dest_dict=self.em,
-                dest_path=('EELS', 'spectrometer_mode'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription',
-                    'Filter selected dispersion_eV/Channel'),
-                dest_dict=self.em,
-                dest_path=('EELS', 'dispersion_per_channel'),
-                cast_fn=float, units='EV', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription',
-                    'Filter selected aperture'),
-                dest_dict=self.em,
-                dest_path=('EELS', 'aperture_size'),
-                cast_fn=lambda x: float(x.replace('mm', '')),
-                units='MilliM', conv_fn=None,  override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription',
-                    'Filter prism shift_eV'),
-                dest_dict=self.em,
-                dest_path=('EELS', 'prism_shift_energy'),
-                cast_fn=float, units='EV', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription',
-                    'Filter drift tube_eV'),
-                dest_dict=self.em,
-                dest_path=('EELS', 'drift_tube_energy'),
-                cast_fn=float, units='EV', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=(
-                    'ObjectInfo', 'ExperimentalDescription',
-                    'Filter total energy loss_eV'),
-                dest_dict=self.em,
-                dest_path=('EELS', 'total_energy_loss'),
-                cast_fn=float, units='EV', conv_fn=None, override=False)
-        ]
-        map_dict_values(mapping)
+        map_table_values(self.raw_meta, self.em, _TIA_MAPPINGS)
+        map_table_values(self.raw_meta, self.em, _TIA_OVERRIDE_MAPPINGS,
+                         override=True)
 
     def _tiff_info(self) -> None:
         """Parses metadata found in FEI/ThermoFisher tiff formats (and perhaps
         others in the future), produced by SEM and dual beam tools
         """
-        mapping = [
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'System', 'Software'),
-                dest_dict=self.em, dest_path=('General_EM',
-                                              'acquisition_software_version'),
-                cast_fn=str, units=None, conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Beam', 'Spot'),
-                dest_dict=self.em, dest_path=('SEM', 'spot_size'),
-                cast_fn=lambda x: int(x) if x != '' else None, units=None,
-                conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Beam', 'HV'),
-                dest_dict=self.em, dest_path=('General_EM',
-                                              'accelerating_voltage'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='KiloV',
-                conv_fn=lambda x: x/1000 if x != '' else None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'EBeam', 'HV'),
-                dest_dict=self.em, dest_path=('General_EM',
-                                              'accelerating_voltage'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='KiloV', conv_fn=lambda x: x / 1000 if x != '' else None,
-                override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'EBeam', 'HFW'),
-                dest_dict=self.em, dest_path=('SEM', 'horizontal_field_width'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'EBeam', 'VFW'),
-                dest_dict=self.em, dest_path=('SEM', 'vertical_field_width'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='M',
-                conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'EBeam', 'WD'),
-                dest_dict=self.em, dest_path=('SEM', 'working_distance'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='M',
-                conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'EBeam', 'BeamCurrent'),
-                dest_dict=self.em, dest_path=('General_EM', 'beam_current'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='A',
-                conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Stage', 'StageX'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'x'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='MilliM',
-                conv_fn=lambda x: x * 1000 if x != '' else None, override=True),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Stage', 'StageY'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'y'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='MilliM',
-                conv_fn=lambda x: x * 1000 if x != '' else None, override=True),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Stage', 'StageZ'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'z'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='MilliM',
-                conv_fn=lambda x: x * 1000 if x != '' else None, override=True),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Stage', 'StageR'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'rotation'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='DEG',
-                conv_fn=None, override=True),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Stage', 'StageT'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'tilt_alpha'),
-                cast_fn=lambda x: float(x) if x != '' else None, units='DEG',
-                conv_fn=None, override=True),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Stage', 'StageTb'),
-                dest_dict=self.em,
-                dest_path=('General_EM', 'stage_position', 'tilt_beta'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='DEG',
-                conv_fn=None, override=True),
-
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Scan', 'PixelWidth'),
-                dest_dict=self.em, dest_path=('SEM', 'pixel_width'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Scan', 'PixelHeight'),
-                dest_dict=self.em, dest_path=('SEM', 'pixel_height'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Scan', 'HorFieldsize'),
-                dest_dict=self.em, dest_path=('SEM', 'horizontal_field_width'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Scan', 'VerFieldsize'),
-                dest_dict=self.em, dest_path=('SEM', 'vertical_field_width'),
-                cast_fn=lambda x: float(x) if x != '' else None,
-                units='M', conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Scan', 'FrameTime'),
-                dest_dict=self.em, dest_path=('General_EM', 'frame_time'),
-                cast_fn=lambda x: float(x) if x else None, units='SEC',
-                conv_fn=None, override=False),
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Image', 'MagnificationMode'),
-                dest_dict=self.em, dest_path=('SEM', 'magnification_mode'),
-                cast_fn=None, units=None, conv_fn=None, override=False),
-            # confirmed in Quanta SEM manual that the pressure units are Pascals
-            MappingElements(
-                source_dict=self.raw_meta,
-                source_path=('fei_metadata', 'Vacuum', 'ChPressure'),
-                dest_dict=self.em, dest_path=('SEM', 'chamber_pressure'),
-                cast_fn=lambda x: float(x) if x else None, units='PA',
-                conv_fn=None, override=False)
-        ]
-        map_dict_values(mapping)
+        fei_metadata = self.raw_meta['fei_metadata']
+        map_table_values(fei_metadata, self.em, _TIFF_MAPPINGS)
+        map_table_values(fei_metadata, self.em, _TIFF_STAGE_MAPPINGS,
+                         override=True)
 
     def implementors(self):
         return ['Jonathon Gaff <jgaff@uchicago.edu>',
@@ -1249,3 +865,10 @@ class ElectronMicroscopyParser(BaseSingleFileParser):
 
     def version(self):
         return '0.1.0'
+
+
+def _parse_in_worker(parser_cls: Type[ElectronMicroscopyParser],
+                     file_path: str, context: Dict = None) -> Dict:
+    """Parse a single file with a fresh instance of ``parser_cls`` (used by
+    :meth:`ElectronMicroscopyParser.parse_many` in its worker processes)"""
+    return parser_cls().parse([file_path], context)
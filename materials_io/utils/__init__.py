@@ -1,4 +1,4 @@
-from typing import Dict, Union, Tuple, Any, Callable, Optional, List
+from typing import Dict, Union, Tuple, Any, Callable, Optional, Iterable
 from typing_extensions import TypedDict
 
 
@@ -18,18 +18,19 @@ def get_nested_dict_value_by_path(nest_dict: Dict,
 
     Returns:
         The value at the path within the nested dictionary; if there's no
-        value there, return ``None``
+        value there (or the path runs into a value that is not a
+        dictionary), return ``None``
     """
     sub_dict = nest_dict
 
     if isinstance(path, str):
         path = (path,)
 
-    for key in path:
-        try:
+    try:
+        for key in path:
             sub_dict = sub_dict[key]
-        except KeyError:
-            return None
+    except (KeyError, TypeError):
+        return None
 
     # coerce empty values to None
     if sub_dict in [{}, dict(), [], '', None]:
@@ -114,7 +115,7 @@ mapping dictionary to map metadata from one place to another.
 """
 
 
-def map_dict_values(mapping: List[MappingElements]):
+def map_dict_values(mapping: Iterable[MappingElements]):
     """
     Helper method to apply map values from one dictionary into another.
     Inspired by the implementation in :func:`hyperspy.io.dict2signal`
@@ -124,7 +125,8 @@ def map_dict_values(mapping: List[MappingElements]):
     the units to set, and potentially a conversion function
 
     Args:
-        mapping: should be a list of dicts, for example:
+        mapping: should be an iterable of dicts (which are not modified), for
+            example:
             [
                 {'source_path': ('source', 'path',),
                  'dest_path': ('dest', 'path',),
@@ -135,17 +137,47 @@ def map_dict_values(mapping: List[MappingElements]):
             ]
     """
     for m in mapping:
-        m.setdefault('cast_fn', None)
-        m.setdefault('units', None)
-        m.setdefault('conv_fn', None)
-
         value = get_nested_dict_value_by_path(
-            nest_dict=m['source_dict'],
-            path=m['source_path'],
-            cast=m['cast_fn'])
+            nest_dict=m['source_dict'], path=m['source_path'],
+            cast=m.get('cast_fn'))
+        if value is None:
+            # nothing to set, so skip the destination lookup entirely
+            continue
         set_nested_dict_value_with_units(
             nest_dict=m['dest_dict'], path=m['dest_path'], value=value,
-            units=m['units'], fn=m['conv_fn'], override=m['override'])
+            units=m.get('units'), fn=m.get('conv_fn'),
+            override=m.get('override', False))
+
+
+def map_table_values(source_dict: Dict, dest_dict: Dict, table: Tuple,
+                     base: Tuple = (), override: bool = False):
+    """
+    Same as :func:`~materials_io.utils.map_dict_values`, but for mappings
+    that are defined once (for example, as module-level constants) rather
+    than being built as a list of
+    :class:`~materials_io.utils.MappingElements` for every call. The source
+    and destination dictionaries are bound at call time, and each source
+    path is given relative to ``base``
+
+    Args:
+        source_dict: The dictionary from which to read the values
+        dest_dict: The dictionary in which to set the values
+        table: should be a tuple of tuples, for example:
+            (
+                (('source', 'path'), ('dest', 'path'), float, 'units',
+                 lambda x: x),
+            )
+            where the elements of each row are the source path, destination
+            path, cast function, units, and conversion function
+        base: A path that is prepended to each source path in ``table``
+        override: Whether to override values already present in ``dest_dict``
+    """
+    for source_path, dest_path, cast_fn, units, conv_fn in table:
+        value = get_nested_dict_value_by_path(source_dict, base + source_path,
+                                              cast_fn)
+        set_nested_dict_value_with_units(
+            nest_dict=dest_dict, path=dest_path, value=value,
+            units=units, fn=conv_fn, override=override)
 
 
 def standardize_unit(u: str) -> str:
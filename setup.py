@@ -1,11 +1,11 @@
 import os
+import re
 from setuptools import setup, find_packages
 
-# single source of truth for package version
-version_ns = {}
+# single source of truth for package version (read, rather than executed)
 with open(os.path.join("materials_io", "version.py")) as f:
-    exec(f.read(), version_ns)
-version = version_ns['__version__']
+    version = re.search(r'^__version__ = [\'"]([^\'"]+)[\'"]', f.read(),
+                        re.MULTILINE).group(1)
 
 # Requirements for the extras
 extra_reqs = {
@@ -23,6 +23,7 @@ extra_reqs['all'] = set(sum(extra_reqs.values(), []))
 setup(
     name="materials_io",
     version=version,
+    python_requires='>=3.7',
     packages=find_packages(include=['materials_io*']) + ['materials_io.schemas'],
     install_requires=['mdf_toolbox>=0.5.3', 'stevedore>=1.28.0'],
     extras_require=extra_reqs,
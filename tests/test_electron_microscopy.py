@@ -12,6 +12,14 @@ def file_path(fname):
                         'data', 'electron_microscopy', fname)
 
 
+class TaggingParser(ElectronMicroscopyParser):
+    """Trivial subclass (defined at module level so it can be pickled)"""
+    def _parse_file(self, file_path, context=None):
+        record = super()._parse_file(file_path, context)
+        record['tagged'] = True
+        return record
+
+
 @pytest.fixture
 def parser():
     return ElectronMicroscopyParser()
@@ -604,6 +612,90 @@ def test_quanta_sem_tif(parser, schema):
     assert jsonschema.validate(res, schema) is None
 
 
+def test_exclude_raw_metadata(parser, schema):
+    res = parser.parse([file_path('test-1.dm3')])
+    assert 'raw_metadata' in res['electron_microscopy']
+
+    res_no_raw = parser.parse([file_path('test-1.dm3')],
+                              context={'include_raw_metadata': False})
+    assert 'raw_metadata' not in res_no_raw['electron_microscopy']
+    del res['electron_microscopy']['raw_metadata']
+    assert res_no_raw == res
+    assert jsonschema.validate(res_no_raw, schema) is None
+
+
+def test_tecnai_missing_lines(parser):
+    # a Tecnai string without "Gun" or "Mode" lines should not raise
+    parser.em = {}
+    parser.raw_meta = {'ImageList': {'TagGroup0': {'ImageTags': {'Tecnai': {
+        'Microscope Info': 'Microscope Titan\u2028Spot 2'}}}}}
+    parser._dm3_tecnai_info()
+    assert parser.em == {
+        'General_EM': {'microscope_name': {'value': 'Titan'}},
+        'TEM': {'spot_size': {'value': 2, 'units': 'UNITLESS'}}}
+
+
+def test_tecnai_multichar_delimiter(parser):
+    # lines end at the whole delimiter, not at any one of its characters
+    parser.em = {}
+    parser.raw_meta = {'ImageList': {'TagGroup0': {'ImageTags': {'Tecnai': {
+        'Microscope Info': 'Microscope Titan 300 kV; Spot 2; '
+                           'Mode TEM Defocus (um) 1 Magn 10x'}}}}}
+    parser._dm3_tecnai_info(delimiter='; ')
+    assert parser.em == {
+        'General_EM': {
+            'microscope_name': {'value': 'Titan 300 kV'},
+            'magnification_indicated': {'value': 10, 'units': 'UNITLESS'}},
+        'TEM': {
+            'spot_size': {'value': 2, 'units': 'UNITLESS'},
+            'operation_mode': {'value': 'TEM'},
+            'defocus': {'value': 1.0, 'units': 'MicroM'}}}
+
+
+def test_release_after_error(parser, monkeypatch):
+    def fail():
+        raise ValueError('processor failed')
+    monkeypatch.setattr(parser, '_dm3_eds_info', fail)
+
+    with pytest.raises(ValueError):
+        parser.parse([file_path('01_test-EDS_spectrum.dm3')])
+    assert parser.hs_data is None
+    assert parser.raw_meta is None
+    assert parser.inst_data is None
+    assert parser.tecnai_info is None
+    assert parser._dm3_tags is None
+
+
+def test_parse_many(parser):
+    files = [file_path(f) for f in ['test-1.dm3', '01_test-EDS_spectrum.dm3',
+                                    '20_quanta_sem.tif']]
+    res = list(parser.parse_many(files, max_workers=2))
+    assert res == [parser.parse([f]) for f in files]
+
+
+def test_parse_many_stop_early(parser):
+    consumed = []
+
+    def paths():
+        for _ in range(30):
+            consumed.append(True)
+            yield file_path('test-1.dm3')
+
+    for res in parser.parse_many(paths(), max_workers=1):
+        break
+    assert res == parser.parse([file_path('test-1.dm3')])
+    # only a bounded window of files is ever submitted ahead
+    assert len(consumed) <= 3
+
+
+def test_parse_many_subclass():
+    files = [file_path(f) for f in ['test-1.dm3', '20_quanta_sem.tif']]
+    sub_parser = TaggingParser()
+    res = list(sub_parser.parse_many(files, max_workers=2))
+    assert all(r['tagged'] for r in res)
+    assert res == [sub_parser.parse([f]) for f in files]
+
+
 def test_implementors(parser):
     assert 'Jonathon Gaff <jgaff@uchicago.edu>' in parser.implementors()
     assert 'Joshua Taillon <joshua.taillon@nist.gov>' in parser.implementors()
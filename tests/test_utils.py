@@ -1,7 +1,8 @@
 from materials_io.utils.interface import (get_available_parsers, execute_parser,
                                           get_available_adapters, run_all_parsers_on_directory,
                                           ParseResult)
-from materials_io.utils import set_nested_dict_value
+from materials_io.utils import (set_nested_dict_value, map_dict_values,
+                                map_table_values)
 from materials_io.image import ImageParser
 import pytest
 import json
@@ -118,3 +119,58 @@ def test_set_nested_dict():
             'key2.2': 'val2.2'},
         'key3': {'key3.1': 5}
     }
+
+
+def test_map_table_values():
+    source = {'base': {'a': '1', 'b': {'c': '2.5'}, 'd': ''}}
+    table = (
+        (('a',), ('out', 'a'), int, None, None),
+        (('b', 'c'), ('out', 'c'), float, 'MilliM', lambda x: x * 2),
+        (('d',), ('out', 'd'), str, None, None),
+        (('missing',), ('out', 'missing'), str, None, None),
+    )
+    expected = {'out': {'a': {'value': 1},
+                        'c': {'value': 5.0, 'units': 'MilliM'}}}
+
+    dest = {}
+    map_table_values(source, dest, table, ('base',))
+    assert dest == expected
+
+    # existing values are kept unless overriding
+    dest = {'out': {'a': {'value': 0}}}
+    map_table_values(source, dest, table[:1], ('base',))
+    assert dest == {'out': {'a': {'value': 0}}}
+    map_table_values(source, dest, table[:1], ('base',), override=True)
+    assert dest == {'out': {'a': {'value': 1}}}
+
+
+def test_map_dict_values():
+    source = {'a': '1', 'b': {'c': '2.5'}}
+    mapping = [
+        {'source_dict': source, 'source_path': 'a', 'dest_path': ('out', 'a'),
+         'cast_fn': int, 'override': False},
+        {'source_dict': source, 'source_path': ('b', 'c'),
+         'dest_path': ('out', 'c'), 'cast_fn': float, 'units': 'MilliM',
+         'conv_fn': lambda x: x * 2},
+    ]
+    dest = {}
+    for m in mapping:
+        m['dest_dict'] = dest
+    originals = [dict(m) for m in mapping]
+
+    # a generator of mappings works, and the mapping dicts are not modified
+    map_dict_values(m for m in mapping)
+    assert dest == {'out': {'a': {'value': 1},
+                            'c': {'value': 5.0, 'units': 'MilliM'}}}
+    assert mapping == originals
+
+    # entries with a missing source never touch the destination
+    class Untouchable(dict):
+        def __getitem__(self, key):
+            raise AssertionError('destination was accessed')
+
+        def setdefault(self, key, default=None):
+            raise AssertionError('destination was accessed')
+
+    map_dict_values([{'source_dict': source, 'source_path': 'missing',
+                      'dest_dict': Untouchable(), 'dest_path': ('out', 'x')}])